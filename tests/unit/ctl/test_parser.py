@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
@@ -12,6 +15,31 @@ from vhs_detective.ctl import parser
 FIXTURE_DIR = Path(__file__).resolve().parents[2] / "fixtures" / "ctl"
 
 
+def _make_fifo(tmp_path: Path) -> Path:
+    if not hasattr(os, "mkfifo"):
+        pytest.skip("named pipes are not available on this platform")
+    fifo = tmp_path / "capture.fifo"
+    os.mkfifo(fifo)
+    return fifo
+
+
+def _start_fifo_writer(
+    fifo: Path, data: bytes, *, hold_open: Optional[threading.Event] = None
+) -> threading.Thread:
+    """Write `data` into `fifo` from a thread, keeping it open until `hold_open` is set."""
+
+    def write() -> None:
+        with fifo.open('wb') as handle:
+            handle.write(data)
+            handle.flush()
+            if hold_open is not None:
+                hold_open.wait(timeout=5)
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+    return writer
+
+
 def test_sniff_ctl_format_detects_raw_logic() -> None:
     fixture = FIXTURE_DIR / "hurricanes_field_sample.csv"
     detected = parser.sniff_ctl_format(fixture)
@@ -109,3 +137,167 @@ def test_sniff_ctl_format_handles_aggregate(tmp_path: Path) -> None:
     aggregate.write_text("time,dt\n0.0,0.1\n0.1,0.1\n", encoding="utf-8")
     detected = parser.sniff_ctl_format(aggregate)
     assert detected == parser.AGGREGATE_CSV
+
+
+def test_load_raw_ctl_pulses_matches_streaming_parser() -> None:
+    fixture = FIXTURE_DIR / "hurricanes_field_sample.csv"
+    kwargs = dict(sample_rate_hz=100_000_000, pulse_level=0, min_pulse_samples=5)
+
+    loaded = parser.load_raw_ctl_pulses(fixture, **kwargs)
+    streamed = list(parser.stream_raw_ctl_pulses(fixture, **kwargs))
+
+    assert loaded == streamed
+    assert parser.load_raw_ctl_pulses(fixture, max_samples=1000, **kwargs) == [
+        pulse for pulse in streamed if pulse.start_sample + pulse.sample_count <= 1000
+    ]
+
+
+def test_load_raw_ctl_pulses_reports_bad_tokens(tmp_path: Path) -> None:
+    capture = tmp_path / "bad.csv"
+    capture.write_text("logic\n1\n0\n2\n1\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="line 4"):
+        parser.load_raw_ctl_pulses(capture)
+
+
+def test_raw_ctl_loaders_reject_unknown_pulse_level(tmp_path: Path) -> None:
+    missing = tmp_path / "missing.csv"
+
+    with pytest.raises(ValueError, match="pulse_level must be 0 or 1"):
+        parser.load_raw_ctl_pulse_array(missing, pulse_level=2)
+    with pytest.raises(ValueError, match="pulse_level must be 0 or 1"):
+        list(parser.stream_raw_ctl_pulses(missing, pulse_level=2))
+
+
+def test_load_raw_ctl_pulse_array_packs_columns() -> None:
+    fixture = FIXTURE_DIR / "hurricanes_field_sample.csv"
+
+    pulses = parser.load_raw_ctl_pulse_array(fixture, sample_rate_hz=100_000_000)
+
+    assert len(pulses) == 19
+    assert pulses.start_sample[0] == 116
+    assert pulses.sample_count[0] == 26
+    assert pulses.start_time[0] == pytest.approx(116 / 100_000_000)
+    assert set(pulses.level) == {0}
+    intervals = pulses.intervals()
+    assert len(intervals) == 18
+    assert intervals[0] == pytest.approx(pulses.start_time[1] - pulses.start_time[0])
+    assert pulses.to_pulses() == list(
+        parser.stream_raw_ctl_pulses(fixture, sample_rate_hz=100_000_000)
+    )
+
+
+def test_stream_raw_ctl_pulses_merges_runs_across_read_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fixture = FIXTURE_DIR / "hurricanes_field_sample.csv"
+    expected = list(parser.stream_raw_ctl_pulses(fixture, min_pulse_samples=5))
+
+    monkeypatch.setattr(parser, "_READ_CHUNK_BYTES", 7)
+
+    assert list(parser.stream_raw_ctl_pulses(fixture, min_pulse_samples=5)) == expected
+    assert parser.load_raw_ctl_pulses(fixture, min_pulse_samples=5) == expected
+
+
+def test_load_raw_ctl_metadata_caches_until_sidecar_changes(tmp_path: Path) -> None:
+    capture = tmp_path / "capture.csv"
+    capture.write_text("logic\n0\n", encoding="utf-8")
+    meta_path = tmp_path / "capture_meta.json"
+
+    assert parser.load_raw_ctl_metadata(capture) is None
+
+    meta_path.write_text(json.dumps({"sample_rate_hz": 200}), encoding="utf-8")
+    first = parser.load_raw_ctl_metadata(capture)
+    assert first is not None and first.sample_rate_hz == 200
+    assert parser.load_raw_ctl_metadata(capture) is first
+
+    meta_path.write_text(json.dumps({"sample_rate_hz": 4000}), encoding="utf-8")
+    updated = parser.load_raw_ctl_metadata(capture)
+    assert updated is not None and updated.sample_rate_hz == 4000
+
+
+def test_stream_raw_ctl_pulses_reads_regular_files_and_pipes_alike(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fixture = FIXTURE_DIR / "hurricanes_field_sample.csv"
+    monkeypatch.setattr(parser, "_READ_CHUNK_BYTES", 1000)
+    mapped = list(parser.stream_raw_ctl_pulses(fixture, min_pulse_samples=5))
+
+    fifo = _make_fifo(tmp_path)
+    writer = _start_fifo_writer(fifo, fixture.read_bytes())
+    piped = list(parser.stream_raw_ctl_pulses(fifo, min_pulse_samples=5))
+    writer.join(timeout=5)
+
+    assert mapped != []
+    assert piped == mapped
+
+
+def test_stream_raw_ctl_pulses_reads_pipes_as_data_arrives(tmp_path: Path) -> None:
+    fifo = _make_fifo(tmp_path)
+    release = threading.Event()
+    writer = _start_fifo_writer(fifo, b"logic\n0\n1\n0\n", hold_open=release)
+
+    pulses = list(parser.stream_raw_ctl_pulses(fifo, sample_rate_hz=1, max_samples=2))
+    still_open = writer.is_alive()
+    release.set()
+    writer.join(timeout=5)
+
+    assert [(p.start_sample, p.sample_count) for p in pulses] == [(0, 1)]
+    assert still_open
+
+
+def test_stream_raw_ctl_pulses_handles_empty_capture(tmp_path: Path) -> None:
+    capture = tmp_path / "empty.csv"
+    capture.write_bytes(b"")
+
+    assert list(parser.stream_raw_ctl_pulses(capture)) == []
+
+
+def test_sniff_ctl_format_only_reads_prefix(tmp_path: Path) -> None:
+    fifo = _make_fifo(tmp_path)
+    release = threading.Event()
+    writer = _start_fifo_writer(fifo, b"logic\n" + b"0\n" * 5000, hold_open=release)
+
+    fmt = parser.sniff_ctl_format(fifo)
+    still_open = writer.is_alive()
+    release.set()
+    writer.join(timeout=5)
+
+    assert fmt == parser.RAW_CAPTURE
+    assert still_open
+
+
+def test_sniff_ctl_format_detects_bare_cr_capture(tmp_path: Path) -> None:
+    capture = tmp_path / "cr_only.csv"
+    capture.write_bytes(b"logic\r0\r0\r1\r")
+
+    assert parser.sniff_ctl_format(capture) == parser.RAW_CAPTURE
+
+
+def test_load_raw_ctl_pulses_accepts_bare_cr_line_endings(tmp_path: Path) -> None:
+    capture = tmp_path / "cr_only.csv"
+    capture.write_bytes(b"logic\r0\r0\r1\r1\r0\r")
+
+    pulses = parser.load_raw_ctl_pulses(capture, sample_rate_hz=1, pulse_level=1)
+
+    assert [(p.start_sample, p.sample_count) for p in pulses] == [(2, 2)]
+
+
+def test_stream_raw_ctl_pulses_cuts_blocks_on_bare_cr(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    capture = tmp_path / "cr_only.csv"
+    capture.write_bytes(b"logic\r0\r0\r1\r1\r0\r")
+    monkeypatch.setattr(parser, "_READ_CHUNK_BYTES", 3)
+
+    pulses = list(parser.stream_raw_ctl_pulses(capture, sample_rate_hz=1, pulse_level=1))
+
+    assert [(p.start_sample, p.sample_count) for p in pulses] == [(2, 2)]
+
+
+def test_stream_raw_ctl_pulses_counts_universal_newlines_in_errors(tmp_path: Path) -> None:
+    capture = tmp_path / "mixed.csv"
+    capture.write_bytes(b"logic\n0\r\r\nx\n")
+
+    with pytest.raises(ValueError, match="'x' on line 4"):
+        list(parser.stream_raw_ctl_pulses(capture))
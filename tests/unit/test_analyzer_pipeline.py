@@ -1,4 +1,4 @@
-from vhs_detective.analyzer.pipeline import run_analysis
+from vhs_detective.analyzer.pipeline import run_analysis, run_detectors
 from vhs_detective.models.core import FrameStats
 
 
@@ -28,3 +28,14 @@ def test_run_analysis_combines_sources() -> None:
     assert len(result.regions) >= 1
     kinds = {region.kind for region in result.regions}
     assert 'video.dark_luma' in kinds
+
+
+def test_run_detectors_thread_pool_matches_serial() -> None:
+    video = [_frame(t / 25, YAVG=1 if 5 <= t < 20 else 10) for t in range(40)]
+    audio = [_frame(float(t), RMS_level=-60 if t < 3 else -10) for t in range(6)]
+
+    serial = run_detectors(video_frames=video, audio_frames=audio)
+    pooled = run_detectors(video_frames=video, audio_frames=audio, max_workers=3)
+
+    assert pooled == serial
+    assert [region.kind for region in serial] == ['video.dark_luma', 'audio.low_rms']
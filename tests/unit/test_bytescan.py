@@ -0,0 +1,12 @@
+from vhs_detective.bytescan import iter_byte_runs
+
+
+def test_iter_byte_runs_reports_run_edges() -> None:
+    mask = bytes([1, 1, 0, 0, 1, 0, 1, 1])
+    assert list(iter_byte_runs(mask, 1, 0)) == [(0, 2), (4, 5), (6, 8)]
+    assert list(iter_byte_runs(bytes([0, 0]), 1, 0)) == []
+
+
+def test_iter_byte_runs_scans_ascii_levels() -> None:
+    assert list(iter_byte_runs(b"0011100", ord("1"), ord("0"))) == [(2, 5)]
+    assert list(iter_byte_runs(b"0011100", ord("0"), ord("1"))) == [(0, 2), (5, 7)]
@@ -1,5 +1,7 @@
+import math
+
 from vhs_detective.detect import baseline
-from vhs_detective.models.core import FrameStats
+from vhs_detective.models.core import FrameStats, FrameStatsTable
 
 
 def _frame(time: float, **kv: float) -> FrameStats:
@@ -41,3 +43,55 @@ def test_detect_audio_silence_regions_handles_low_rms() -> None:
     assert len(regions) == 1
     assert regions[0].kind == 'audio.low_rms'
     assert regions[0].evidence[0].metric == 'RMS_level'
+
+
+def test_detect_video_dark_regions_splits_on_missing_metric() -> None:
+    frames = [
+        _frame(0.0, YAVG=2),
+        _frame(0.1, YAVG=1),
+        _frame(0.2),
+        _frame(0.3, YAVG=3),
+        _frame(0.4, YAVG=0.5),
+    ]
+    regions = baseline.detect_video_dark_regions(
+        frames,
+        yavg_threshold=4,
+        min_duration=0.15,
+    )
+    assert [(r.start_time, r.evidence[0].pts_time) for r in regions] == [
+        (0.0, 0.1),
+        (0.3, 0.4),
+    ]
+    assert regions[1].end_time == 0.5
+    assert regions[1].score == 3.5
+
+
+def test_detectors_accept_frame_stats_table() -> None:
+    frames = [
+        _frame(0.0, YAVG=10, RMS_level=-60),
+        _frame(1.0, YAVG=1),
+        _frame(2.0, YAVG=1, RMS_level=-70),
+        _frame(3.0, YAVG=10, RMS_level=-10),
+    ]
+    table = FrameStatsTable(frames)
+
+    assert baseline.detect_video_dark_regions(table) == baseline.detect_video_dark_regions(frames)
+    assert math.isnan(table.column('RMS_level')[1])
+    assert table.column('YAVG') is table.column('YAVG')
+    assert 'FrameStats(' not in repr(table)
+
+
+def test_detectors_include_values_equal_to_threshold() -> None:
+    frames = [
+        _frame(0.0, YAVG=5, RMS_level=-40),
+        _frame(1.0, YAVG=4, RMS_level=-45),
+        _frame(2.0, YAVG=4, RMS_level=-45),
+        _frame(3.0, YAVG=math.nan, RMS_level=math.nan),
+        _frame(4.0, YAVG=5, RMS_level=-40),
+    ]
+
+    dark = baseline.detect_video_dark_regions(frames, yavg_threshold=4, min_duration=1.0)
+    silent = baseline.detect_audio_silence_regions(frames, rms_threshold=-45, min_duration=1.0)
+
+    assert [(r.start_time, r.end_time) for r in dark] == [(1.0, 3.0)]
+    assert [(r.start_time, r.end_time) for r in silent] == [(1.0, 3.0)]
@@ -1,11 +1,13 @@
 """Analysis pipeline that orchestrates detectors across data sources."""
 from __future__ import annotations
 
-from typing import List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional, Sequence
 
 from ..detect import baseline as baseline_detect
 from ..models.anomaly import AnalysisResult, Region
-from ..models.core import CTLPulse, FrameStats
+from ..models.core import CTLPulse, FrameStats, FrameStatsTable
 
 
 def run_analysis(
@@ -13,15 +15,15 @@ def run_analysis(
     video_frames: Sequence[FrameStats],
     audio_frames: Optional[Sequence[FrameStats]] = None,
     ctl_pulses: Optional[Sequence[CTLPulse]] = None,
+    max_workers: int = 1,
 ) -> AnalysisResult:
     """Run all detectors across available data sources."""
 
-    regions: List[Region] = []
-    regions.extend(baseline_detect.detect_video_dark_regions(video_frames))
-    if audio_frames:
-        regions.extend(baseline_detect.detect_audio_silence_regions(audio_frames))
-
-    # Future: add CTL + fusion detectors here
+    regions = run_detectors(
+        video_frames=video_frames,
+        audio_frames=audio_frames,
+        max_workers=max_workers,
+    )
     regions.sort(key=lambda region: region.start_time)
 
     return AnalysisResult(
@@ -30,3 +32,39 @@ def run_analysis(
         audio_frames=audio_frames,
         ctl_pulses=ctl_pulses,
     )
+
+
+def run_detectors(
+    *,
+    video_frames: Sequence[FrameStats],
+    audio_frames: Optional[Sequence[FrameStats]] = None,
+    max_workers: int = 1,
+) -> List[Region]:
+    """Run every applicable detector and concatenate their regions.
+
+    Detectors are independent pure functions over their own columns, so with
+    ``max_workers > 1`` they run on a thread pool.  They are pure Python and
+    hold the GIL today, hence the serial default.  Regions come back in
+    detector order regardless of scheduling.
+    """
+
+    jobs: List[Callable[[], List[Region]]] = [
+        partial(baseline_detect.detect_video_dark_regions, FrameStatsTable(video_frames)),
+    ]
+    if audio_frames:
+        jobs.append(
+            partial(baseline_detect.detect_audio_silence_regions, FrameStatsTable(audio_frames))
+        )
+    # Future: add CTL + fusion detectors here
+
+    if max_workers <= 1 or len(jobs) < 2:
+        results = [job() for job in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+            futures = [pool.submit(job) for job in jobs]
+            results = [future.result() for future in futures]
+
+    regions: List[Region] = []
+    for detected in results:
+        regions.extend(detected)
+    return regions
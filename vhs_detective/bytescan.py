@@ -0,0 +1,26 @@
+"""Byte-level scanning helpers shared by the CTL parser and detectors."""
+from __future__ import annotations
+
+from typing import Iterator, Tuple
+
+
+def iter_byte_runs(data: bytes, value: int, other: int) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of each run of `value` bytes in `data`.
+
+    `data` must hold only the bytes `value` and `other`.  Both edges of a
+    run are located with single-byte `bytes.find`, which CPython hands to
+    `memchr`; that scans a machine word (or SIMD register) per step, so the
+    cost per run is independent of its length.
+    """
+
+    find = data.find
+    end = 0
+    while True:
+        start = find(value, end)
+        if start < 0:
+            return
+        end = find(other, start)
+        if end < 0:
+            yield start, len(data)
+            return
+        yield start, end
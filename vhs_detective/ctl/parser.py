@@ -2,20 +2,36 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
+import mmap
+import os
+import re
+import stat
+from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Iterator, List, Optional, TextIO
+from typing import Generator, Iterable, Iterator, List, Optional, Union
 
-from ..models.core import CTLPulse
+from ..bytescan import iter_byte_runs
+from ..models.core import CTLPulse, CTLPulseArray
 
 DEFAULT_SAMPLE_RATE_HZ = 100_000_000
 _RAW_HEADERS = {"logic", "level"}
 RAW_CAPTURE = "raw_logic_capture"
 AGGREGATE_CSV = "aggregate_csv"
 
+_LEADING_BLANKS_RE = re.compile(rb"[ \t\r\n\v\f]*([^\r\n]*)")
+_INLINE_WHITESPACE = b" \t\r\v\f"
+_LEVEL_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_READ_CHUNK_BYTES = 1 << 20
+_SNIFF_BYTES = 4096
 
-@dataclass
+
+@dataclass(frozen=True)
 class RawCtlMetadata:
     """Optional metadata that accompanies a raw logic capture."""
 
@@ -76,16 +92,53 @@ def load_raw_ctl_pulses(
     min_pulse_samples: int = 1,
     max_samples: Optional[int] = None,
 ) -> List[CTLPulse]:
-    """Materialize all pulses from a raw logic CSV."""
+    """Materialize all pulses from a raw logic CSV.
 
-    return list(
-        stream_raw_ctl_pulses(
-            path,
-            sample_rate_hz=sample_rate_hz,
-            pulse_level=pulse_level,
-            min_pulse_samples=min_pulse_samples,
-            max_samples=max_samples,
-        )
+    Thin object adapter over `load_raw_ctl_pulse_array`.  Use
+    `stream_raw_ctl_pulses` for captures that are too large to hold in memory.
+    """
+
+    return load_raw_ctl_pulse_array(
+        path,
+        sample_rate_hz=sample_rate_hz,
+        pulse_level=pulse_level,
+        min_pulse_samples=min_pulse_samples,
+        max_samples=max_samples,
+    ).to_pulses()
+
+
+def load_raw_ctl_pulse_array(
+    path: Path,
+    *,
+    sample_rate_hz: int = DEFAULT_SAMPLE_RATE_HZ,
+    pulse_level: int = 0,
+    min_pulse_samples: int = 1,
+    max_samples: Optional[int] = None,
+) -> CTLPulseArray:
+    """Load all pulses from a raw logic CSV into packed columns.
+
+    Samples are run-length encoded with C-level byte scans instead of a
+    per-sample Python loop; only one Python step runs per level run.
+    """
+
+    if min_pulse_samples < 1:
+        raise ValueError("min_pulse_samples must be >= 1")
+    if pulse_level not in (0, 1):
+        raise ValueError("pulse_level must be 0 or 1")
+
+    run_starts = array('q')
+    run_lengths = array('q')
+    with _open_line_blocks(path) as blocks:
+        chunks = _iter_logic_samples(blocks, max_samples=max_samples)
+        for run_start, run_length in _iter_level_runs(chunks, level=pulse_level):
+            if run_length >= min_pulse_samples:
+                run_starts.append(run_start)
+                run_lengths.append(run_length)
+    return CTLPulseArray.from_runs(
+        run_starts,
+        run_lengths,
+        level=pulse_level,
+        sample_rate_hz=sample_rate_hz,
     )
 
 
@@ -126,10 +179,12 @@ def stream_raw_ctl_pulses(
 
     if min_pulse_samples < 1:
         raise ValueError("min_pulse_samples must be >= 1")
+    if pulse_level not in (0, 1):
+        raise ValueError("pulse_level must be 0 or 1")
 
-    with path.open('r', encoding='utf-8', errors='replace', newline='') as handle:
-        yield from _stream_raw_ctl_pulses_from_handle(
-            handle,
+    with _open_line_blocks(path) as blocks:
+        yield from _stream_raw_ctl_pulses_from_blocks(
+            blocks,
             sample_rate_hz=sample_rate_hz,
             pulse_level=pulse_level,
             min_pulse_samples=min_pulse_samples,
@@ -137,33 +192,20 @@ def stream_raw_ctl_pulses(
         )
 
 
-def _stream_raw_ctl_pulses_from_handle(
-    handle: TextIO,
+def _stream_raw_ctl_pulses_from_blocks(
+    blocks: Iterable[bytes],
     *,
     sample_rate_hz: int,
     pulse_level: int,
     min_pulse_samples: int,
     max_samples: Optional[int],
 ) -> Iterator[CTLPulse]:
-    sample_iter = _iter_logic_samples(handle, max_samples=max_samples)
-    run_level = None
-    run_length = 0
-    run_start = 0
+    chunks = _iter_logic_samples(blocks, max_samples=max_samples)
     pulse_idx = 0
-
-    for level in sample_iter:
-        if run_level is None:
-            run_level = level
-            run_length = 1
-            continue
-
-        if level == run_level:
-            run_length += 1
-            continue
-
+    for run_start, run_length in _iter_level_runs(chunks, level=pulse_level):
         maybe_pulse = _build_pulse(
             idx=pulse_idx,
-            run_level=run_level,
+            run_level=pulse_level,
             run_start=run_start,
             run_length=run_length,
             sample_rate_hz=sample_rate_hz,
@@ -174,24 +216,37 @@ def _stream_raw_ctl_pulses_from_handle(
             pulse_idx += 1
             yield maybe_pulse
 
-        run_start += run_length
-        run_level = level
-        run_length = 1
-
-    if run_level is None:
-        return
 
-    maybe_pulse = _build_pulse(
-        idx=pulse_idx,
-        run_level=run_level,
-        run_start=run_start,
-        run_length=run_length,
-        sample_rate_hz=sample_rate_hz,
-        pulse_level=pulse_level,
-        min_pulse_samples=min_pulse_samples,
-    )
-    if maybe_pulse is not None:
-        yield maybe_pulse
+def _iter_level_runs(chunks: Iterable[bytes], *, level: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(start_sample, length)`` for every run of `level` across chunks.
+
+    A run touching the end of a chunk is carried over and merged with the
+    matching prefix of the next chunk.
+    """
+
+    level_byte = b"%d" % level
+    other_code = ord(b"%d" % (1 - level))
+    offset = 0
+    pending_start: Optional[int] = None
+    pending_length = 0
+    for chunk in chunks:
+        if pending_start is not None and not chunk.startswith(level_byte):
+            yield pending_start, pending_length
+            pending_start = None
+        for start, end in iter_byte_runs(chunk, level_byte[0], other_code):
+            if pending_start is not None:
+                # Only the first match (at offset 0) continues a carried run.
+                run_start, run_length = pending_start, pending_length + end
+                pending_start = None
+            else:
+                run_start, run_length = offset + start, end - start
+            if end == len(chunk):
+                pending_start, pending_length = run_start, run_length
+            else:
+                yield run_start, run_length
+        offset += len(chunk)
+    if pending_start is not None:
+        yield pending_start, pending_length
 
 
 def sniff_ctl_format(path: Path) -> str:
@@ -210,11 +265,24 @@ def sniff_ctl_format(path: Path) -> str:
 
 
 def load_raw_ctl_metadata(path: Path) -> Optional[RawCtlMetadata]:
-    """Load adjoining *_meta.json metadata if present."""
+    """Load adjoining *_meta.json metadata if present.
+
+    Parsed sidecars are cached by path, size and mtime, so repeat loads of
+    an unchanged capture cost a single `stat`.
+    """
 
     meta_path = _derive_meta_path(path)
-    if not meta_path.exists():
+    try:
+        meta_stat = meta_path.stat()
+    except OSError:
         return None
+    return _load_raw_ctl_metadata_cached(str(meta_path), meta_stat.st_mtime_ns, meta_stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_raw_ctl_metadata_cached(meta_path_str: str, mtime_ns: int, size: int) -> RawCtlMetadata:
+    # `mtime_ns` and `size` only key the cache so edited sidecars are re-read.
+    meta_path = Path(meta_path_str)
     try:
         data = json.loads(meta_path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError) as exc:  # pragma: no cover - once metadata exists tests guard
@@ -238,43 +306,208 @@ def _derive_meta_path(path: Path) -> Path:
 
 
 def _peek_header_and_first_value(path: Path) -> tuple[str, str]:
-    with path.open("r", encoding="utf-8", errors="replace") as handle:
-        header = handle.readline()
-        first_value = ""
-        for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            first_value = stripped
+    """Return the header line and first non-blank line from a bounded prefix."""
+
+    with path.open('rb') as handle:
+        prefix = handle.read(_SNIFF_BYTES)
+    lines = prefix.splitlines()
+    if len(prefix) == _SNIFF_BYTES and lines:
+        lines.pop()  # possibly cut mid-line
+    header = lines[0] if lines else b""
+    first_value = next((line.strip() for line in islice(lines, 1, None) if line.strip()), b"")
+    return (
+        header.decode('utf-8', errors='replace'),
+        first_value.decode('utf-8', errors='replace'),
+    )
+
+
+@contextmanager
+def _open_line_blocks(path: Path) -> Iterator[Generator[bytes, None, None]]:
+    """Open a raw capture as an iterator of line-aligned byte blocks.
+
+    Regular files are memory-mapped: blocks are cut straight out of the
+    mapping (no read buffer, no tail concatenation) and the kernel is told
+    to read ahead sequentially.  Anything `mmap` refuses (pipes, special
+    files) is read with `_iter_line_blocks`; empty files yield nothing.
+    """
+
+    with path.open('rb') as handle:
+        file_stat = os.fstat(handle.fileno())
+        if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size == 0:
+            yield _iter_no_blocks()
+            return
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            blocks = _iter_line_blocks(handle)
+            try:
+                yield blocks
+            finally:
+                blocks.close()
+            return
+
+        with mapped:
+            if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            blocks = _iter_mapped_line_blocks(mapped)
+            try:
+                yield blocks
+            finally:
+                blocks.close()
+
+
+def _iter_no_blocks() -> Generator[bytes, None, None]:
+    """Yield nothing: the block source for an empty capture."""
+
+    yield from ()
+
+
+def _iter_mapped_line_blocks(mapped: mmap.mmap) -> Generator[bytes, None, None]:
+    """Yield ~`_READ_CHUNK_BYTES` slices of `mapped`, each ending on a line break."""
+
+    size = len(mapped)
+    start = 0
+    while start < size:
+        end = min(start + _READ_CHUNK_BYTES, size)
+        while end < size:
+            cut = _line_cut(mapped, start, end)
+            if cut >= 0:
+                end = cut
+                break
+            # A single line longer than a block; widen until it ends.
+            end = min(end + _READ_CHUNK_BYTES, size)
+        yield mapped[start:end]
+        start = end
+
+
+def _iter_line_blocks(handle: io.BufferedIOBase) -> Generator[bytes, None, None]:
+    """Yield line-aligned blocks read from `handle`.
+
+    `read1` returns whatever is available (up to `_READ_CHUNK_BYTES`), so a
+    pipe is consumed as data arrives instead of waiting for a full block.
+    """
+
+    tail = b""
+    while True:
+        data = handle.read1(_READ_CHUNK_BYTES)
+        if not data:
             break
-    return header, first_value
+        block = tail + data
+        cut = _line_cut(block, 0, len(block))
+        if cut < 0:
+            tail = block
+            continue
+        yield block[:cut]
+        tail = block[cut:]
+    if tail:
+        yield tail
+
+
+def _line_cut(buf: Union[bytes, mmap.mmap], start: int, end: int) -> int:
+    """Return the offset just past the last line break in ``buf[start:end]``, or -1.
+
+    Line breaks follow universal newlines (``\n``, ``\r\n`` or a bare ``\r``).
+    A ``\r`` in the final byte is not a safe cut: it may pair with a ``\n``
+    that has not been seen yet.
+    """
+
+    cut = buf.rfind(b"\n", start, end)
+    if cut < 0:
+        cut = buf.rfind(b"\r", start, end - 1)
+    return -1 if cut < 0 else cut + 1
 
 
-def _iter_logic_samples(handle: TextIO, *, max_samples: Optional[int]) -> Iterator[int]:
-    """Yield logic levels (0/1) from a raw capture while skipping the header."""
+def _count_lines(data: bytes) -> int:
+    """Count universal-newline line breaks, matching text mode with ``newline=''``."""
 
-    header_consumed = False
-    samples = 0
-    for line_no, raw_line in enumerate(handle, start=1):
+    return data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+
+
+def _iter_logic_samples(blocks: Iterable[bytes], *, max_samples: Optional[int]) -> Iterator[bytes]:
+    """Yield logic levels from line-aligned blocks as chunks of b"0"/b"1" bytes.
+
+    Each block is validated and decoded with a few C-level byte operations
+    (see `_decode_sample_block`).  The header line (if any) is skipped.
+    """
+
+    header_pending = True
+    lines_done = 0
+    remaining = max_samples
+    for block in blocks:
+        if header_pending:
+            match = _LEADING_BLANKS_RE.match(block)
+            if match is not None and match.group(1).strip():
+                header_pending = False
+                if not _is_int_cell(match.group(1)):
+                    lines_done += _count_lines(block[:match.end()])
+                    block = block[match.end():]
+
+        samples = _decode_sample_block(block)
+        if samples is None:
+            samples = _parse_logic_lines(block, first_line_no=lines_done + 1, limit=remaining)
+        lines_done += _count_lines(block)
+
+        if remaining is not None:
+            samples = samples[:remaining]
+            remaining -= len(samples)
+        if samples:
+            yield samples
+        if remaining == 0:
+            return
+
+
+def _decode_sample_block(block: bytes) -> Optional[bytes]:
+    """Return the samples of a one-0/1-per-line block, or None if it is irregular.
+
+    Once whitespace and blank lines are dropped a regular block alternates
+    sample byte / newline, so two strided slices validate and decode it.
+    Bare ``\r`` line endings are left to the universal-newline fallback.
+    """
+
+    if block.count(b"\r") != block.count(b"\r\n"):
+        return None
+    cells = block.translate(None, _INLINE_WHITESPACE)
+    while b"\n\n" in cells:
+        cells = cells.replace(b"\n\n", b"\n")
+    first = 1 if cells.startswith(b"\n") else 0
+    samples = cells[first::2]
+    if samples.translate(None, b"01") or cells[first + 1::2].translate(None, b"\n"):
+        return None
+    return samples
+
+
+def _parse_logic_lines(block: bytes, *, first_line_no: int, limit: Optional[int]) -> bytes:
+    """Line-by-line fallback for blocks that are not strictly one 0/1 per line.
+
+    Keeps `int()` semantics for unusual cells and reports bad tokens with
+    their line number.
+    """
+
+    levels = bytearray()
+    text = io.StringIO(block.decode('utf-8', errors='replace'), newline='')
+    for line_no, raw_line in enumerate(text, start=first_line_no):
+        if limit is not None and len(levels) >= limit:
+            break
         cell = raw_line.strip()
         if not cell:
             continue
         try:
             level = int(cell)
         except ValueError:
-            if not header_consumed:
-                header_consumed = True
-                continue
             raise ValueError(f"Unexpected token {cell!r} on line {line_no}") from None
 
         if level not in (0, 1):
             raise ValueError(f"Logic levels must be 0 or 1; saw {level!r} on line {line_no}")
+        levels.append(level)
+    return bytes(levels.translate(_LEVEL_TO_ASCII))
 
-        header_consumed = True
-        yield level
-        samples += 1
-        if max_samples is not None and samples >= max_samples:
-            break
+
+def _is_int_cell(cell: bytes) -> bool:
+    try:
+        int(cell)
+    except ValueError:
+        return False
+    return True
 
 
 def _build_pulse(
@@ -1,89 +1,111 @@
 """Baseline heuristics for video/audio derived metrics."""
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass
+from itertools import pairwise, repeat
 from statistics import median
-from typing import Callable, Iterable, List, Sequence, Tuple
+from typing import Callable, Dict, List, Literal, Sequence, Union
 
+from ..bytescan import iter_byte_runs
 from ..models.anomaly import Evidence, Region
-from ..models.core import FrameStats
+from ..models.core import FrameStats, FrameStatsTable
+
+ThresholdOp = Literal['le', 'ge', 'lt', 'gt']
+
+_COMPARATORS: Dict[ThresholdOp, Callable[[float, float], bool]] = {
+    'le': operator.le,
+    'ge': operator.ge,
+    'lt': operator.lt,
+    'gt': operator.gt,
+}
 
 
 def detect_video_dark_regions(
-    frames: Sequence[FrameStats],
+    frames: Union[Sequence[FrameStats], FrameStatsTable],
     *,
     yavg_threshold: float = 6.0,
     min_duration: float = 0.25,
 ) -> List[Region]:
     """Detect spans where the average luma drops very low."""
 
-    if not frames:
+    table = _as_table(frames)
+    if not table:
         return []
-    frame_step = _estimate_frame_step(frames, fallback=1 / 30.0)
+    frame_step = _estimate_frame_step(table.pts_time, fallback=1 / 30.0)
     return _detect_span_regions(
-        frames=frames,
+        table=table,
         metric='YAVG',
-        predicate=lambda value: value <= yavg_threshold,
+        op='le',
+        threshold=yavg_threshold,
         min_duration=min_duration,
         source='video',
         kind='video.dark_luma',
         frame_step=frame_step,
         score_fn=lambda v: max(0.0, yavg_threshold - v),
-        extreme_selector=_min_by_value,
+        extreme_selector=_argmin_in_span,
     )
 
 
 def detect_audio_silence_regions(
-    frames: Sequence[FrameStats],
+    frames: Union[Sequence[FrameStats], FrameStatsTable],
     *,
     rms_threshold: float = -50.0,
     min_duration: float = 1.0,
 ) -> List[Region]:
     """Detect spans where overall RMS level stays very low."""
 
-    if not frames:
+    table = _as_table(frames)
+    if not table:
         return []
-    frame_step = _estimate_frame_step(frames, fallback=1.0)
+    frame_step = _estimate_frame_step(table.pts_time, fallback=1.0)
     return _detect_span_regions(
-        frames=frames,
+        table=table,
         metric='RMS_level',
-        predicate=lambda value: value <= rms_threshold,
+        op='le',
+        threshold=rms_threshold,
         min_duration=min_duration,
         source='audio',
         kind='audio.low_rms',
         frame_step=frame_step,
         score_fn=lambda v: max(0.0, rms_threshold - v),
-        extreme_selector=_min_by_value,
+        extreme_selector=_argmin_in_span,
     )
 
 
 def _detect_span_regions(
     *,
-    frames: Sequence[FrameStats],
+    table: FrameStatsTable,
     metric: str,
-    predicate: Callable[[float], bool],
+    op: ThresholdOp,
+    threshold: float,
     min_duration: float,
     source: str,
     kind: str,
     frame_step: float,
     score_fn: Callable[[float], float],
-    extreme_selector: Callable[[Sequence[Tuple[FrameStats, float]]], Tuple[FrameStats, float]],
+    extreme_selector: Callable[[Sequence[float], int, int], int],
 ) -> List[Region]:
+    pts_times = table.pts_time
+    values = table.column(metric)
+    mask = _threshold_mask(values, op, threshold)
+
     regions: List[Region] = []
-    for span in _iter_metric_spans(frames, metric=metric, predicate=predicate):
-        start_time = span[0][0].pts_time
-        end_time = span[-1][0].pts_time + frame_step
+    for start, end in iter_byte_runs(mask, 1, 0):
+        start_time = pts_times[start]
+        end_time = pts_times[end - 1] + frame_step
         if end_time <= start_time:
             end_time = start_time + frame_step
         if (end_time - start_time) < min_duration:
             continue
-        pivot_frame, pivot_value = extreme_selector(span)
+        pivot = extreme_selector(values, start, end)
+        pivot_value = values[pivot]
         evidence = [
             Evidence(
                 source=source,
                 metric=metric,
                 value=pivot_value,
-                pts_time=pivot_frame.pts_time,
+                pts_time=pts_times[pivot],
             )
         ]
         regions.append(
@@ -98,37 +120,27 @@ def _detect_span_regions(
     return regions
 
 
-def _iter_metric_spans(
-    frames: Sequence[FrameStats],
-    *,
-    metric: str,
-    predicate: Callable[[float], bool],
-) -> Iterable[List[Tuple[FrameStats, float]]]:
-    current: List[Tuple[FrameStats, float]] = []
-    for frame in frames:
-        value = frame.kv.get(metric)
-        if value is None or not predicate(value):
-            if current:
-                yield current
-                current = []
-            continue
-        current.append((frame, value))
-    if current:
-        yield current
+def _threshold_mask(values: Sequence[float], op: ThresholdOp, threshold: float) -> bytes:
+    """Return a 1-byte-per-frame mask of ``value <op> threshold``.
 
+    NaN (missing) values are always 0.
+    """
 
-def _estimate_frame_step(frames: Sequence[FrameStats], *, fallback: float) -> float:
-    if len(frames) < 2:
-        return fallback
-    deltas = [
-        max(0.0, frames[i + 1].pts_time - frames[i].pts_time)
-        for i in range(len(frames) - 1)
-    ]
-    filtered = [delta for delta in deltas if delta > 0]
-    if not filtered:
+    return bytes(map(_COMPARATORS[op], values, repeat(threshold)))
+
+
+def _as_table(frames: Union[Sequence[FrameStats], FrameStatsTable]) -> FrameStatsTable:
+    if isinstance(frames, FrameStatsTable):
+        return frames
+    return FrameStatsTable(frames)
+
+
+def _estimate_frame_step(pts_times: Sequence[float], *, fallback: float) -> float:
+    steps = [later - earlier for earlier, later in pairwise(pts_times) if later > earlier]
+    if not steps:
         return fallback
-    return median(filtered)
+    return median(steps)
 
 
-def _min_by_value(span: Sequence[Tuple[FrameStats, float]]) -> Tuple[FrameStats, float]:
-    return min(span, key=lambda item: item[1])
+def _argmin_in_span(values: Sequence[float], start: int, end: int) -> int:
+    return min(range(start, end), key=values.__getitem__)
@@ -1,12 +1,16 @@
 """CTL-focused detection helpers."""
 from __future__ import annotations
 
-from typing import List
+from typing import List, Sequence, Union
 
-from ..models.core import CTLPulse
+from ..models.core import CTLPulse, CTLPulseArray
 
 
-def detect_ctl_outliers(pulses: List[CTLPulse]) -> List[dict]:
-    """Placeholder CTL anomaly detector."""
+def detect_ctl_outliers(pulses: Union[Sequence[CTLPulse], CTLPulseArray]) -> List[dict]:
+    """Placeholder CTL anomaly detector.
+
+    Accepts either `CTLPulse` objects or a `CTLPulseArray`; numeric scans
+    should work on the packed columns (e.g. `CTLPulseArray.intervals`).
+    """
 
     return []
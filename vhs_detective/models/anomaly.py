@@ -7,7 +7,7 @@ from typing import List, Optional, Sequence
 from .core import CTLPulse, FrameStats
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Evidence:
     """Single metric sample supporting an anomaly decision."""
 
@@ -17,7 +17,7 @@ class Evidence:
     pts_time: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Region:
     """An anomalous span across the tape timeline."""
 
@@ -1,9 +1,13 @@
 """Shared data structures used across the pipeline."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice, repeat
+from math import nan
+from operator import sub, truediv
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 
 @dataclass
@@ -14,6 +18,35 @@ class FrameStats:
     kv: Dict[str, float]
 
 
+@dataclass(eq=False)
+class FrameStatsTable:
+    """Column-oriented view over a sequence of `FrameStats`.
+
+    Metric columns are packed `array.array('d')` values, built on first use
+    and cached so every detector reading the same metric shares one pass
+    over the frames.  Frames lacking a metric hold NaN in its column.
+    """
+
+    frames: Sequence[FrameStats] = field(repr=False)
+    pts_time: array[float] = field(init=False, repr=False)
+    metrics: Dict[str, array[float]] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.pts_time = array('d', [frame.pts_time for frame in self.frames])
+
+    def __len__(self) -> int:
+        return len(self.pts_time)
+
+    def column(self, metric: str) -> array[float]:
+        """Return the values of `metric` for every frame (NaN when absent)."""
+
+        values = self.metrics.get(metric)
+        if values is None:
+            values = array('d', [frame.kv.get(metric, nan) for frame in self.frames])
+            self.metrics[metric] = values
+        return values
+
+
 @dataclass
 class CTLPulse:
     """Single CTL pulse observation.
@@ -53,6 +86,75 @@ class CTLPulse:
         return self.t + self.dt
 
 
+@dataclass
+class CTLPulseArray:
+    """Column-oriented CTL pulses from a single raw capture.
+
+    Each field is a packed `array.array` indexed by pulse number, so scans
+    over e.g. `start_time` touch 8 bytes per pulse instead of a full
+    `CTLPulse` object.  Use `to_pulses` where the object API is expected.
+    """
+
+    sample_rate_hz: int
+    start_time: array[float] = field(default_factory=lambda: array('d'))
+    duration: array[float] = field(default_factory=lambda: array('d'))
+    level: array[int] = field(default_factory=lambda: array('b'))
+    start_sample: array[int] = field(default_factory=lambda: array('q'))
+    sample_count: array[int] = field(default_factory=lambda: array('q'))
+
+    @classmethod
+    def from_runs(
+        cls,
+        run_starts: Sequence[int],
+        run_lengths: Sequence[int],
+        *,
+        level: int,
+        sample_rate_hz: int,
+    ) -> CTLPulseArray:
+        """Build the columns from run-length encoded sample offsets."""
+
+        return cls(
+            sample_rate_hz=sample_rate_hz,
+            start_time=array('d', map(truediv, run_starts, repeat(sample_rate_hz))),
+            duration=array('d', map(truediv, run_lengths, repeat(sample_rate_hz))),
+            level=array('b', [level]) * len(run_starts),
+            start_sample=array('q', run_starts),
+            sample_count=array('q', run_lengths),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start_time)
+
+    def intervals(self) -> array[float]:
+        """Start-to-start spacing between consecutive pulses."""
+
+        return array('d', map(sub, islice(self.start_time, 1, None), self.start_time))
+
+    def to_pulses(self) -> List[CTLPulse]:
+        """Expand the columns into `CTLPulse` objects."""
+
+        return [
+            CTLPulse(
+                t=t,
+                dt=dt,
+                idx=idx,
+                level=level,
+                start_sample=start_sample,
+                sample_count=sample_count,
+                sample_rate_hz=self.sample_rate_hz,
+            )
+            for idx, (t, dt, level, start_sample, sample_count) in enumerate(
+                zip(
+                    self.start_time,
+                    self.duration,
+                    self.level,
+                    self.start_sample,
+                    self.sample_count,
+                )
+            )
+        ]
+
+
 @dataclass
 class Inputs:
     """All files discovered for a single base-name."""